@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 from qcodes import InstrumentChannel, ManualParameter, Parameter
@@ -13,6 +14,15 @@ if TYPE_CHECKING:
     from qcodes_qick.instruments import QickInstrument
 
 
+@functools.cache
+def _channel_num_or_none(num_channels: int) -> Enum:
+    """Get a validator accepting None or a channel number below `num_channels`.
+
+    Validators are immutable, so a single instance is shared by all channels of an instrument instead of building one per channel.
+    """
+    return Enum(None, *range(num_channels))
+
+
 class DacChannel(InstrumentChannel):
     parent: QickInstrument
 
@@ -30,7 +40,7 @@ class DacChannel(InstrumentChannel):
             name="matching_adc",
             instrument=self,
             label="Channel number of the ADC to match the frequency unit to.",
-            vals=Enum(None, *range(len(self.parent.soccfg["readouts"]))),
+            vals=_channel_num_or_none(len(self.parent.soccfg["readouts"])),
             initial_value=None,
         )
         self.nqz = ManualParameter(
@@ -97,7 +107,7 @@ class AdcChannel(InstrumentChannel):
             name="matching_dac",
             instrument=self,
             label="Channel number of the DAC to match the frequency unit to.",
-            vals=Enum(None, *range(len(self.parent.soccfg["gens"]))),
+            vals=_channel_num_or_none(len(self.parent.soccfg["gens"])),
             initial_value=None,
         )
         self.freq = HzParameter(
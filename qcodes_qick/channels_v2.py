@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -12,6 +13,15 @@ if TYPE_CHECKING:
     from qcodes_qick.instruments import QickInstrument
 
 
+@functools.cache
+def _channel_num_or_none(num_channels: int) -> Enum:
+    """Get a validator accepting None or a channel number below `num_channels`.
+
+    The result is cached, so every DAC/ADC channel reuses the same Enum.
+    """
+    return Enum(None, *range(num_channels))
+
+
 class DacChannel(InstrumentChannel, ABC):
     """Abstract base class for a DAC channel.
 
@@ -43,7 +53,7 @@ class DacChannel(InstrumentChannel, ABC):
             name="matching_adc",
             instrument=self,
             label="Matching ADC",
-            vals=Enum(None, *range(len(parent.soccfg["readouts"]))),
+            vals=_channel_num_or_none(len(parent.soccfg["readouts"])),
             initial_value=None,
             docstring="Channel number of the ADC to match the frequency resolution to.",
         )
@@ -245,7 +255,7 @@ class AdcChannel(InstrumentChannel):
             name="matching_dac",
             instrument=self,
             label="Channel number of the DAC to match the frequency unit to.",
-            vals=Enum(None, *range(len(self.parent.soccfg["gens"]))),
+            vals=_channel_num_or_none(len(self.parent.soccfg["gens"])),
             initial_value=None,
         )
         self.freq = ManualParameter(
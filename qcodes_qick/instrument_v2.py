@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import itertools
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Literal
 
@@ -31,9 +31,17 @@ if TYPE_CHECKING:
     from qcodes.dataset.measurements import DataSaver
 
 
+def _as_complex(iq: np.ndarray) -> np.ndarray:
+    """View an array of (I, Q) pairs along the last axis as complex numbers I + 1j * Q.
+
+    Equivalent to `iq.dot([1, 1j])`, but without a copy for the C-contiguous float64 arrays returned by `acquire()`.
+    """
+    return np.ascontiguousarray(iq, dtype=np.float64).view(np.complex128)[..., 0]
+
+
 class SoftwareSweep:
     parameters: Sequence[Parameter]
-    values: Sequence[float]
+    values: np.ndarray
 
     def __init__(
         self,
@@ -53,13 +61,47 @@ class SoftwareSweep:
         assert len({parameter.unit for parameter in self.parameters}) == 1
 
         if isinstance(start, (Sequence, np.ndarray)):
-            self.values = start
+            values = np.asarray(start)
+            if values.dtype.kind not in "biuf":
+                # keep mixed values such as 'auto' as the original Python objects
+                values = np.asarray(start, dtype=object)
         else:
-            self.values = np.linspace(start, stop, num)
-        if skip_first:
-            self.values = self.values[1:]
-        if skip_last:
-            self.values = self.values[:-1]
+            values = np.linspace(start, stop, num)
+        self.values = values[(1 if skip_first else 0) : (-1 if skip_last else None)]
+
+
+def _iterate_software_sweeps(
+    software_sweeps: Sequence[SoftwareSweep],
+) -> Iterator[tuple[int, ...]]:
+    """Step through all points of the software sweeps, setting the parameters for each point.
+
+    The parameters must already hold the first value of every sweep. Only the parameters of sweeps whose index has changed since the previous point are set again, so the first point sets nothing.
+
+    Parameters
+    ----------
+    software_sweeps : Sequence[SoftwareSweep]
+        The software sweeps, outermost first.
+
+    Yields
+    ------
+    tuple[int, ...]
+        The index into the values of each sweep at the current point.
+    """
+    software_sweep_ranges = [range(len(sweep.values)) for sweep in software_sweeps]
+    previous_indices = (0,) * len(software_sweeps)
+    for indices in tqdm_product(*software_sweep_ranges, mininterval=0.5):
+        for sweep, index, previous_index in zip(
+            software_sweeps, indices, previous_indices
+        ):
+            if index == previous_index:
+                continue
+            for parameter in sweep.parameters:
+                if isinstance(parameter, SweepableParameter):
+                    parameter.fast_set(sweep.values[index])
+                else:
+                    parameter.set(sweep.values[index])
+        previous_indices = indices
+        yield indices
 
 
 class QickInstrument(Instrument):
@@ -73,8 +115,9 @@ class QickInstrument(Instrument):
         #   soccfg: QickConfig containing the current configuration of the board
         self.soc, self.soccfg = make_proxy(ns_host, ns_port)
 
-        # set of all parameters which have been assigned a QickSweep object
-        self.swept_params: set[SweepableParameter] = set()
+        # all parameters which have been assigned a QickSweep object, in the order of assignment
+        # (a dict is used as an ordered set, so that iterating over it is deterministic)
+        self.swept_params: dict[SweepableParameter, None] = {}
 
         assert len(self.soccfg["tprocs"]) == 1
         tproc_type = self.soccfg["tprocs"][0]["type"]
@@ -278,7 +321,8 @@ class QickInstrument(Instrument):
         else:
             time_parameter = None
 
-        # generate the program just to obtain the ADC channel numbers and the number of readouts per shot
+        # generate the program to obtain the ADC channel numbers and the number of readouts per shot
+        # (the parameters already hold their values for the first acquisition, which reuses it)
         program = AveragerProgram(self, hardware_loop_counts)
         adc_channel_nums = program.ro_chs.keys()
         reads_per_shot = [ro["trigs"] for ro in program.ro_chs.values()]
@@ -343,17 +387,11 @@ class QickInstrument(Instrument):
                     save_shots_as_npy,
                     software_sweep_indices=(),
                     progress=True,
+                    program=program,
                 )
             else:
-                software_sweep_ranges = [
-                    range(len(sweep.values)) for sweep in software_sweeps
-                ]
-                for indices in tqdm_product(*software_sweep_ranges):
-                    # update the software sweep parameters
-                    for sweep, index in zip(software_sweeps, indices):
-                        for parameter in sweep.parameters:
-                            parameter.set(sweep.values[index])
-
+                # the parameters already hold the first values, which the program was generated with
+                for indices in _iterate_software_sweeps(software_sweeps):
                     self._run_hardware_loops(
                         datasaver,
                         software_sweeps,
@@ -368,7 +406,10 @@ class QickInstrument(Instrument):
                         save_shots_as_npy,
                         software_sweep_indices=indices,
                         progress=False,
+                        program=program,
                     )
+                    # the parameters change from here on, so later points need new programs
+                    program = None
 
         return datasaver.run_id
 
@@ -394,25 +435,30 @@ class QickInstrument(Instrument):
         save_shots_as_npy: bool,
         software_sweep_indices: Sequence[int],
         progress: bool,
+        program: AveragerProgram | None,
     ):
         if acquisition_mode == "ddr4":
             self.ddr4_buffer.arm()
 
-        # run the program
-        program = AveragerProgram(self, hardware_loop_counts)
+        hard_avgs = self.hard_avgs.get()
+        soft_avgs = self.soft_avgs.get()
+
+        # run the program, generating it unless the caller has one for the current settings
+        if program is None:
+            program = AveragerProgram(self, hardware_loop_counts)
         reads_per_shot = [ro["trigs"] for ro in program.ro_chs.values()]
         if acquisition_mode == "decimated":
             all_iq = qick.qick_asm.AcquireMixin.acquire_decimated(
                 self=program,
                 soc=self.soc,
-                rounds=self.soft_avgs.get(),
+                rounds=soft_avgs,
                 progress=progress,
             )
             for channel_index in range(len(reads_per_shot)):
                 channel_iq = all_iq[channel_index]
                 length = len(program.get_time_axis(channel_index))
                 all_iq[channel_index] = channel_iq.reshape(
-                    self.hard_avgs.get(), -1, reads_per_shot[channel_index], length, 2
+                    hard_avgs, -1, reads_per_shot[channel_index], length, 2
                 )
                 if len(hardware_loop_counts) == 0:
                     all_iq[channel_index] = all_iq[channel_index][:, 0, :, :, :]
@@ -420,7 +466,7 @@ class QickInstrument(Instrument):
             all_iq = qick.qick_asm.AcquireMixin.acquire(
                 self=program,
                 soc=self.soc,
-                rounds=self.soft_avgs.get(),
+                rounds=soft_avgs,
                 progress=progress,
             )
 
@@ -432,11 +478,12 @@ class QickInstrument(Instrument):
 
         # Add the shot axis to the result if necessary
         if acquisition_mode == "accumulated shots":
-            shape = (self.hard_avgs.get(), *hardware_loop_counts.values())
-            values = np.arange(self.hard_avgs.get())
-            for _ in range(len(hardware_loop_counts)):
-                values = values[..., np.newaxis]
-            values = np.broadcast_to(values, shape)
+            shape = (hard_avgs, *hardware_loop_counts.values())
+            # a read-only view repeating the shot index along the hardware loop axes
+            values = np.broadcast_to(
+                np.arange(hard_avgs).reshape(-1, *(1,) * len(hardware_loop_counts)),
+                shape,
+            )
             param_values.append((shot_parameter, values))
         else:
             shape = hardware_loop_counts.values()
@@ -475,9 +522,7 @@ class QickInstrument(Instrument):
                 Path(datasaver.dataset.path_to_db).parent / f"{datasaver.run_id}_shots"
             )
             path.mkdir(exist_ok=True)
-            reads_per_shot = [ro["trigs"] for ro in program.ro_chs.values()]
-            for channel_index in range(len(reads_per_shot)):
-                channel_num = list(program.ro_chs.keys())[channel_index]
+            for channel_index, channel_num in enumerate(program.ro_chs):
                 for readout_num in range(reads_per_shot[channel_index]):
                     shots = program.acc_buf[channel_index][..., readout_num, :].dot(
                         [1, 1j]
@@ -515,13 +560,12 @@ class QickInstrument(Instrument):
 
         reads_per_shot = [ro["trigs"] for ro in program.ro_chs.values()]
         result_index = 0
-        for channel_index in range(len(reads_per_shot)):
+        for channel_index, channel_num in enumerate(program.ro_chs):
             channel_iq = all_iq[channel_index]
-            channel_num = list(program.ro_chs.keys())[channel_index]
             for readout_num in range(reads_per_shot[channel_index]):
                 # Add acquired data to the result
                 if acquisition_mode == "accumulated":
-                    iq = channel_iq[readout_num, ...].dot([1, 1j])
+                    iq = _as_complex(channel_iq[readout_num, ...])
                     if iq.shape == (1,):
                         iq = iq[0]
                     datasaver.add_result(
@@ -555,7 +599,7 @@ class QickInstrument(Instrument):
                     # Save acquired waveform averaged over shots
                     assert time_parameter is not None
                     time = program.get_time_axis(channel_index) / 1e6
-                    iq = channel_iq[..., readout_num, :, :].mean(axis=0).dot([1, 1j])
+                    iq = _as_complex(channel_iq[..., readout_num, :, :].mean(axis=0))
                     datasaver.add_result(
                         *param_values,
                         (time_parameter, time),
@@ -620,10 +664,9 @@ class QickInstrument(Instrument):
             progress=progress,
         )
         iqs = {}
-        for channel_index in range(len(reads_per_shot)):
-            channel_num = list(program.ro_chs.keys())[channel_index]
+        for channel_index, channel_num in enumerate(program.ro_chs):
             for readout_num in range(reads_per_shot[channel_index]):
-                iq = all_iq[channel_index][readout_num, ...].dot([1, 1j])
+                iq = _as_complex(all_iq[channel_index][readout_num, ...])
                 name = "iq"
                 if reads_per_shot[channel_index] > 1:
                     name += f"{readout_num}"
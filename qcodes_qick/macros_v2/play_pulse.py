@@ -34,13 +34,16 @@ class PlayPulse(Macro):
         pulse: DacPulse,
         t: float | QickParam | Literal["auto"] = "auto",
     ) -> None:
-        assert pulse.parent.parent is parent
+        # look up the attributes of the pulse only once
+        dac = pulse.parent
+        envelope = getattr(pulse, "envelope", None)
+        assert dac.parent is parent
         name = parent.append_counter_to_macro_name("PlayPulse")
         super().__init__(
             parent,
             name,
-            dacs=[pulse.parent],
-            envelopes=[pulse.envelope] if hasattr(pulse, "envelope") else (),
+            dacs=[dac],
+            envelopes=[envelope] if envelope is not None else (),
             pulses=[pulse],
         )
 
@@ -48,7 +51,7 @@ class PlayPulse(Macro):
             name="dac_channel",
             instrument=self,
             label="DAC channel",
-            initial_cache_value=self.dacs[0].channel_num,
+            initial_cache_value=dac.channel_num,
         )
         self.pulse_name = Parameter(
             name="pulse_name",
@@ -66,9 +69,10 @@ class PlayPulse(Macro):
         )
 
     def create_qick_macro(self) -> qick.asm_v2.Macro:
+        t = self.t.qick_param
         return qick.asm_v2.Pulse(
             ch=self.dacs[0].channel_num,
             name=self.pulse_name.get(),
-            t=self.t.qick_param * 1e6 if self.t.get() != "auto" else "auto",
+            t=t if isinstance(t, str) else t * 1e6,
             tag=self.short_name,
         )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+import numpy as np
 from qcodes import ManualParameter
 from qcodes.validators import Numbers
 
@@ -23,6 +24,13 @@ class HardwareParameter(ABC, ManualParameter):
     @abstractmethod
     def float2int(self, f: float) -> int: ...
 
+    def int2float_array(self, i: np.ndarray) -> np.ndarray:
+        """Apply `int2float` to an array of register values in a single call.
+
+        The conversions are plain arithmetic which NumPy broadcasts over the whole array. Subclasses with a conversion that does not broadcast should override this method.
+        """
+        return np.asarray(self.int2float(np.asarray(i)), dtype=float)
+
 
 class HzParameter(HardwareParameter):
     """Frequency parameter with automatic rounding to a multiple of the frequency unit of the specified DAC/ADC channel. The `get_raw()` method returns the register value (int) that should be sent to QICK."""
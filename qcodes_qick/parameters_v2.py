@@ -14,6 +14,25 @@ if TYPE_CHECKING:
     from qcodes_qick.instrument_v2 import QickInstrument
 
 
+def _find_qick_instrument(instrument: InstrumentBase) -> QickInstrument:
+    """Get the QickInstrument at the root of the submodule tree containing `instrument`.
+
+    The result is cached on every InstrumentModule on the way up, so that later lookups starting from the same submodule return immediately.
+    """
+    visited = []
+    inst = instrument
+    while isinstance(inst, InstrumentModule):
+        root = inst.__dict__.get("_qick_instrument_root")
+        if root is not None:
+            inst = root
+            break
+        visited.append(inst)
+        inst = inst.parent
+    for module in visited:
+        module.__dict__["_qick_instrument_root"] = inst
+    return inst
+
+
 class SweepableNumbers(Validator):
     def __init__(
         self,
@@ -22,12 +41,18 @@ class SweepableNumbers(Validator):
     ) -> None:
         self.numbers = Numbers(min_value, max_value)
         self._valid_values = (min_value, max_value)
+        self._min_value = min_value
+        self._max_value = max_value
 
     def validate(self, value: float | QickParam, context: str = ""):
         if isinstance(value, QickParam):
             self.numbers.validate(value.minval(), context)
             self.numbers.validate(value.maxval(), context)
-        else:
+        elif not (
+            isinstance(value, Numbers.validtypes)
+            and self._min_value <= value <= self._max_value
+        ):
+            # only valid scalars take the inline check above; let Numbers raise the error
             self.numbers.validate(value, context)
 
 
@@ -48,11 +73,14 @@ class SweepableParameter(Parameter):
         allow_auto: bool = False,
         **kwargs,
     ) -> None:
-        # get parent of parent until a QickInstrument is reached
-        inst = instrument
-        while isinstance(inst, InstrumentModule):
-            inst = inst.parent
-        self.qick_instrument: QickInstrument = inst
+        self.qick_instrument: QickInstrument = _find_qick_instrument(instrument)
+
+        # bounds for fast_set() to check scalar values against
+        self._min_value = min_value
+        self._max_value = max_value
+
+        # whether I am currently in self.qick_instrument.swept_params
+        self._is_swept = False
 
         if allow_auto:
             validator = MultiType(SweepableNumbers(min_value, max_value), Enum("auto"))
@@ -70,17 +98,35 @@ class SweepableParameter(Parameter):
         )
 
     def set_raw(self, value: float | QickParam | Literal["auto"]) -> None:
-        if isinstance(value, (float, int)):
+        if isinstance(value, Numbers.validtypes):
             # convert scalar value to QickParam
             self.qick_param = QickParam(value)
         else:
             self.qick_param = value
 
         # keep track of all swept parameters of the instrument
-        if isinstance(value, QickParam) and value.is_sweep():
-            self.qick_instrument.swept_params.add(self)
-        elif self in self.qick_instrument.swept_params:
-            self.qick_instrument.swept_params.remove(self)
+        is_swept = isinstance(value, QickParam) and value.is_sweep()
+        if is_swept != self._is_swept:
+            if is_swept:
+                self.qick_instrument.swept_params[self] = None
+            else:
+                self.qick_instrument.swept_params.pop(self, None)
+            self._is_swept = is_swept
+
+    def fast_set(self, value: float | QickParam | Literal["auto"]) -> None:
+        """Set the value, bypassing the validator and the set wrapper for in-range scalars.
+
+        Anything else, e.g. a QickParam or 'auto', goes through the full `set()`.
+        """
+        if (
+            isinstance(value, Numbers.validtypes)
+            and self._min_value <= value <= self._max_value
+        ):
+            self.set_raw(value)
+            # update the cache the way the set wrapper does, since cache.set() would validate again
+            self.cache._update_with(value=value, raw_value=value)  # noqa: SLF001
+        else:
+            self.set(value)
 
     def get_raw(self) -> float | QickParam | Literal["auto"]:
         value = self.qick_param
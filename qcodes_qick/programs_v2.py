@@ -21,9 +21,12 @@ class AveragerProgram(qick.asm_v2.AveragerProgramV2):
     ):
         self.qick_instrument = qick_instrument
         self.hardware_loop_counts = hardware_loop_counts
+        # The timing parameters are scaled for every program rather than cached,
+        # because multiplying a QickParam links it to the derived QickParam that
+        # this program will round, which is what SweepableParameter.get() reads.
         super().__init__(
             qick_instrument.soccfg,
-            reps=qick_instrument.hard_avgs.get(),
+            reps=qick_instrument.hard_avgs.cache.get(),
             final_delay=qick_instrument.final_delay.qick_param * 1e6,
             final_wait=qick_instrument.final_wait.qick_param * 1e6,
             initial_delay=qick_instrument.initial_delay.qick_param * 1e6,
@@ -23,19 +23,58 @@ if TYPE_CHECKING:
     from qcodes_qick.parameters import HardwareParameter
 
 
+def _meshgrid_views(values: Sequence[np.ndarray]) -> list[np.ndarray]:
+    """Equivalent of `np.meshgrid(*values, indexing="ij")` returning read-only views instead of dense copies."""
+    shape = tuple(len(v) for v in values)
+    return [np.broadcast_to(v, shape) for v in np.ix_(*values)]
+
+
+def _as_complex(iq: np.ndarray) -> np.ndarray:
+    """View an array of (I, Q) pairs along the last axis as complex numbers I + 1j * Q.
+
+    Equivalent to `iq.dot([1, 1j])`, but without a copy if `iq` is already a C-contiguous float64 array.
+    """
+    return np.ascontiguousarray(iq, dtype=np.float64).view(np.complex128)[..., 0]
+
+
 class QickProtocol(InstrumentModule):
     parent: QickInstrument
 
     def __init__(self, parent: QickInstrument, name: str, **kwargs):
         super().__init__(parent, name, **kwargs)
-        self.instructions: Sequence[QickInstruction] = []
+        self.instructions = []
         assert parent.tproc_version.get() == 1
         parent.add_submodule(name, self)
 
+    @property
+    def instructions(self) -> Sequence[QickInstruction]:
+        return self._instructions
+
+    @instructions.setter
+    def instructions(self, instructions: Sequence[QickInstruction]) -> None:
+        self._instructions = instructions
+        # collect the objects to initialize once, rather than every time a program is generated
+        self.unique_instructions: tuple[QickInstruction, ...] = tuple(
+            dict.fromkeys(instructions)
+        )
+        # sort the channels so that programs declare them in a deterministic order
+        self.dacs: list[DacChannel] = sorted(
+            set().union(
+                *(instruction.dacs for instruction in self.unique_instructions)
+            ),
+            key=lambda dac: dac.channel_num,
+        )
+        self.adcs: list[AdcChannel] = sorted(
+            set().union(
+                *(instruction.adcs for instruction in self.unique_instructions)
+            ),
+            key=lambda adc: adc.channel_num,
+        )
+
 
 class SoftwareSweep:
     parameters: Sequence[Parameter]
-    values: Sequence[float]
+    values: np.ndarray
 
     def __init__(
         self,
@@ -55,13 +94,13 @@ class SoftwareSweep:
         assert len({parameter.unit for parameter in self.parameters}) == 1
 
         if isinstance(start, (Sequence, np.ndarray)):
-            self.values = start
+            values = np.asarray(start)
+            if values.dtype.kind not in "biuf":
+                # keep mixed values such as 'auto' as the original Python objects
+                values = np.asarray(start, dtype=object)
         else:
-            self.values = np.linspace(start, stop, num)
-        if skip_first:
-            self.values = self.values[1:]
-        if skip_last:
-            self.values = self.values[:-1]
+            values = np.linspace(start, stop, num)
+        self.values = values[(1 if skip_first else 0) : (-1 if skip_last else None)]
 
 
 class HardwareSweep:
@@ -78,7 +117,10 @@ class HardwareSweep:
 
         self.step_int = parameter.float2int((stop - start) / (num - 1))
         start_int = parameter.float2int(start)
-        self.values_int = start_int + self.step_int * np.arange(num, dtype=np.int64)
+        # compute start_int + step_int * i in place, in a single array
+        self.values_int = np.arange(num, dtype=np.int64)
+        self.values_int *= self.step_int
+        self.values_int += start_int
         if skip_first:
             self.values_int = self.values_int[1:]
         if skip_last:
@@ -90,7 +132,7 @@ class HardwareSweep:
         self.start = parameter.int2float(self.start_int)
         self.stop = parameter.int2float(self.stop_int)
         self.step = parameter.int2float(self.step_int)
-        self.values = np.array([parameter.int2float(i) for i in self.values_int])
+        self.values = parameter.int2float_array(self.values_int)
 
 
 class SweepProtocol(ABC, QickProtocol):
@@ -117,6 +159,11 @@ class SweepProtocol(ABC, QickProtocol):
             initial_value=1,
         )
 
+        # parameters representing the acquired data, see get_iq_parameters()
+        self._iq_parameters: dict[
+            tuple[tuple[int, ...], tuple[int, ...]], list[Parameter]
+        ] = {}
+
     @abstractmethod
     def generate_program(
         self,
@@ -131,52 +178,48 @@ class SweepProtocol(ABC, QickProtocol):
         hardware_sweeps: Sequence[HardwareSweep] = (),
         decimated: bool = False,
     ) -> int:
-        # initialize and register the sweep parameters
-        setpoints = []
+        # initialize the sweep parameters
         for sweep in software_sweeps:
-            sweep.parameters[0].set(sweep.values[0])
-            setpoints.append(sweep.parameters[0])
-            meas.register_parameter(sweep.parameters[0], paramtype="numeric")
-            for parameter in sweep.parameters[1:]:
+            for parameter in sweep.parameters:
                 parameter.set(sweep.values[0])
         for sweep in hardware_sweeps:
             sweep.parameter.set(sweep.values[0])
-            setpoints.append(sweep.parameter)
-            meas.register_parameter(sweep.parameter, paramtype="array")
+
+        # collect all the setpoints and their paramtypes, then register them in a single pass
+        setpoint_paramtypes = {
+            sweep.parameters[0]: "numeric" for sweep in software_sweeps
+        }
+        setpoint_paramtypes.update(
+            {sweep.parameter: "array" for sweep in hardware_sweeps}
+        )
         if decimated:
             time_parameter = Parameter("time", label="Time", unit="sec")
-            setpoints.append(time_parameter)
-            meas.register_parameter(time_parameter, paramtype="array")
+            setpoint_paramtypes[time_parameter] = "array"
+        for parameter, paramtype in setpoint_paramtypes.items():
+            meas.register_parameter(parameter, paramtype=paramtype)
+        setpoints = tuple(setpoint_paramtypes)
 
-        # generate the program just to obtain the ADC channel numbers and the number of readouts per shot
-        program = self.generate_program(self.parent.soccfg)
+        # generate the program for the initial values of the sweep parameters, which also tells us the ADC channel numbers and the number of readouts per shot
+        program = self.generate_program(self.parent.soccfg, hardware_sweeps)
         adc_channel_nums = program.ro_chs.keys()
         reads_per_shot = [ro["trigs"] for ro in program.ro_chs.values()]
         assert len(adc_channel_nums) == len(reads_per_shot)
         assert sum(reads_per_shot) > 0
 
         # create and register the parameters representing the acquired data
-        iq_parameters = []
+        iq_parameters = self.get_iq_parameters(adc_channel_nums, reads_per_shot)
         paramtype = "array" if (len(hardware_sweeps) > 0 or decimated) else "complex"
-        for i, channel_num in enumerate(adc_channel_nums):
-            for readout_num in range(reads_per_shot[i]):
-                name = "iq"
-                if reads_per_shot[i] > 1:
-                    name += f"{readout_num}"
-                if len(adc_channel_nums) > 1:
-                    name += f"_ch{channel_num}"
-
-                iq_parameter = Parameter(name)
-                iq_parameters.append(iq_parameter)
-                meas.register_parameter(
-                    iq_parameter, setpoints=setpoints, paramtype=paramtype
-                )
+        for iq_parameter in iq_parameters:
+            meas.register_parameter(
+                iq_parameter, setpoints=setpoints, paramtype=paramtype
+            )
 
         with meas.run() as datasaver:
             if len(software_sweeps) == 0:
                 if decimated:
                     self.run_hardware_sweeps_decimated(
                         datasaver,
+                        program,
                         software_sweeps,
                         hardware_sweeps,
                         time_parameter,
@@ -186,6 +229,7 @@ class SweepProtocol(ABC, QickProtocol):
                 else:
                     self.run_hardware_sweeps(
                         datasaver,
+                        program,
                         software_sweeps,
                         hardware_sweeps,
                         iq_parameters,
@@ -193,13 +237,22 @@ class SweepProtocol(ABC, QickProtocol):
                     )
             else:
                 software_sweep_values = [sweep.values for sweep in software_sweeps]
-                for current_values in tqdm_product(*software_sweep_values):
-                    for sweep, value in zip(software_sweeps, current_values):
-                        for parameter in sweep.parameters:
-                            parameter.set(value)
+                program_values = tuple(values[0] for values in software_sweep_values)
+                for current_values in tqdm_product(
+                    *software_sweep_values, mininterval=0.5
+                ):
+                    program = self.update_software_params(
+                        program,
+                        software_sweeps,
+                        hardware_sweeps,
+                        program_values,
+                        current_values,
+                    )
+                    program_values = current_values
                     if decimated:
                         self.run_hardware_sweeps_decimated(
                             datasaver,
+                            program,
                             software_sweeps,
                             hardware_sweeps,
                             time_parameter,
@@ -209,6 +262,7 @@ class SweepProtocol(ABC, QickProtocol):
                     else:
                         self.run_hardware_sweeps(
                             datasaver,
+                            program,
                             software_sweeps,
                             hardware_sweeps,
                             iq_parameters,
@@ -217,9 +271,79 @@ class SweepProtocol(ABC, QickProtocol):
 
         return datasaver.run_id
 
+    def get_iq_parameters(
+        self, adc_channel_nums: Sequence[int], reads_per_shot: Sequence[int]
+    ) -> list[Parameter]:
+        """Get the parameters representing the acquired data, one per readout.
+
+        The parameters are created once per combination of ADC channels and readouts per shot, and reused by later runs.
+
+        Parameters
+        ----------
+        adc_channel_nums : Sequence[int]
+            The ADC channels used by the program.
+        reads_per_shot : Sequence[int]
+            The number of readouts per shot on each ADC channel.
+
+        Returns
+        -------
+        list[Parameter]
+        """
+        key = (tuple(adc_channel_nums), tuple(reads_per_shot))
+        if key not in self._iq_parameters:
+            channel_suffix = "_ch{}" if len(adc_channel_nums) > 1 else ""
+            self._iq_parameters[key] = [
+                Parameter(
+                    "iq"
+                    + (f"{readout_num}" if reads > 1 else "")
+                    + channel_suffix.format(channel_num)
+                )
+                for channel_num, reads in zip(adc_channel_nums, reads_per_shot)
+                for readout_num in range(reads)
+            ]
+        return self._iq_parameters[key]
+
+    def update_software_params(
+        self,
+        program: SweepProgram,
+        software_sweeps: Sequence[SoftwareSweep],
+        hardware_sweeps: Sequence[HardwareSweep],
+        program_values: Sequence[float],
+        values: Sequence[float],
+    ) -> SweepProgram:
+        """Set the software sweep parameters and return a matching program.
+
+        Parameters
+        ----------
+        program : SweepProgram
+            The program generated for `program_values`.
+        software_sweeps : Sequence[SoftwareSweep]
+        hardware_sweeps : Sequence[HardwareSweep]
+        program_values : Sequence[float]
+            The values of the software sweep parameters that `program` was generated for.
+        values : Sequence[float]
+            The new values of the software sweep parameters.
+
+        Returns
+        -------
+        SweepProgram
+            `program` itself if none of the values changed, otherwise a newly generated program.
+        """
+        changed = False
+        for sweep, old_value, value in zip(software_sweeps, program_values, values):
+            if value == old_value:
+                continue
+            changed = True
+            for parameter in sweep.parameters:
+                parameter.set(value)
+        if not changed:
+            return program
+        return self.generate_program(self.parent.soccfg, hardware_sweeps)
+
     def run_hardware_sweeps(
         self,
         datasaver: DataSaver,
+        program: SweepProgram,
         software_sweeps: Sequence[SoftwareSweep],
         hardware_sweeps: Sequence[HardwareSweep],
         iq_parameters: Sequence[Parameter],
@@ -232,17 +356,28 @@ class SweepProtocol(ABC, QickProtocol):
         # bookkeeping that AcquireMixin.acquire() does not, and it reads the number of
         # software repetitions ("rounds") from the program's cfg. Bypassing it is what
         # required the finish_acquire() workaround and is the source of empty buffers.
-        program = self.generate_program(self.parent.soccfg, hardware_sweeps)
         all_iq = program.acquire(
             soc=self.parent.soc,
             load_pulses=True,
             progress=progress,
         )
 
+        # The sweep coordinates are the same for every readout, so collect them once
+        param_values = []
+
+        # Add software sweep paramters to the result
+        for sweep in software_sweeps:
+            param_values.append((sweep.parameters[0], sweep.parameters[0].get()))
+
+        # Add hardware sweep parameters to the result
+        sweep_values = [sweep.values for sweep in hardware_sweeps]
+        sweep_coordinates = _meshgrid_views(sweep_values)
+        for sweep, value in zip(hardware_sweeps, sweep_coordinates):
+            param_values.append((sweep.parameter, value))
+
         reads_per_shot = [ro["trigs"] for ro in program.ro_chs.values()]
         iq_index = 0
-        for channel_index in range(len(reads_per_shot)):
-            channel_num = list(program.ro_chs)[channel_index]
+        for channel_index, channel_num in enumerate(program.ro_chs):
             channel_iq = np.asarray(all_iq[channel_index])
 
             # Check against an empty acquisition buffer.
@@ -258,37 +393,26 @@ class SweepProtocol(ABC, QickProtocol):
                 )
                 raise RuntimeError(msg)
 
-            channel_iq = channel_iq.reshape(reads_per_shot[channel_index], -1, 2)
+            channel_iq = _as_complex(
+                channel_iq.reshape(reads_per_shot[channel_index], -1, 2)
+            )
             for readout_num in range(reads_per_shot[channel_index]):
-                iq = channel_iq[readout_num, :, :].dot([1, 1j])
+                iq = channel_iq[readout_num, :]
 
                 if len(hardware_sweeps) == 0:
                     # The simple-averaging case returns a single averaged point per
                     # readout. Reduce to one scalar regardless of whether the
                     # remaining axis has length 1 or has been averaged differently.
-                    iq = complex(np.asarray(iq).reshape(-1).mean())
-
-                result = []
-
-                # Add software sweep paramters to the result
-                for sweep in software_sweeps:
-                    result.append((sweep.parameters[0], sweep.parameters[0].get()))
-
-                # Add hardware sweep parameters to the result
-                sweep_values = [sweep.values for sweep in hardware_sweeps]
-                sweep_coordinates = np.meshgrid(*sweep_values, indexing="ij")
-                for sweep, value in zip(hardware_sweeps, sweep_coordinates):
-                    result.append((sweep.parameter, value))
+                    iq = complex(iq.mean())
 
                 # Add acquired data to the result
-                result.append((iq_parameters[iq_index], iq))
+                datasaver.add_result(*param_values, (iq_parameters[iq_index], iq))
                 iq_index += 1
 
-                datasaver.add_result(*result)
-
     def run_hardware_sweeps_decimated(
         self,
         datasaver: DataSaver,
+        program: SweepProgram,
         software_sweeps: Sequence[SoftwareSweep],
         hardware_sweeps: Sequence[HardwareSweep],
         time_parameter: Parameter,
@@ -298,17 +422,23 @@ class SweepProtocol(ABC, QickProtocol):
         # Run the program. As in run_hardware_sweeps(), use the program's own
         # acquire_decimated() rather than calling AcquireMixin.acquire_decimated()
         # directly, so reads_per_shot / save_experiments bookkeeping is handled.
-        program = self.generate_program(self.parent.soccfg, hardware_sweeps)
         all_iq = program.acquire_decimated(
             soc=self.parent.soc,
             load_pulses=True,
             progress=progress,
         )
 
+        # Add software sweep paramters to the result
+        software_param_values = []
+        for sweep in software_sweeps:
+            software_param_values.append(
+                (sweep.parameters[0], sweep.parameters[0].get())
+            )
+
+        hard_avgs = self.hard_avgs.get()
         reads_per_shot = [ro["trigs"] for ro in program.ro_chs.values()]
         iq_index = 0
-        for channel_index in range(len(reads_per_shot)):
-            channel_num = list(program.ro_chs)[channel_index]
+        for channel_index, channel_num in enumerate(program.ro_chs):
             channel_iq = np.asarray(all_iq[channel_index])
 
             if channel_iq.size == 0 or reads_per_shot[channel_index] == 0:
@@ -316,38 +446,43 @@ class SweepProtocol(ABC, QickProtocol):
                     f"ADC channel {channel_num} returned no decimated data: "
                     f"acquire shape={channel_iq.shape}, "
                     f"trigs={reads_per_shot[channel_index]}, "
-                    f"reps={self.hard_avgs.get()}, rounds={self.soft_avgs.get()}. "
+                    f"reps={hard_avgs}, rounds={self.soft_avgs.get()}. "
                     "Check the Readout trigger/readout channel match and the timing "
                     "(adc_trig_offset / wait_for_adc)."
                 )
                 raise RuntimeError(msg)
 
-            length = len(program.get_time_axis(channel_index))
-            channel_iq = channel_iq.reshape(
-                self.hard_avgs.get(), -1, reads_per_shot[channel_index], length, 2
+            time_axis = program.get_time_axis(channel_index)
+            channel_iq = _as_complex(
+                channel_iq.reshape(
+                    hard_avgs,
+                    -1,
+                    reads_per_shot[channel_index],
+                    len(time_axis),
+                    2,
+                )
             )
-            for readout_num in range(reads_per_shot[channel_index]):
-                iq = channel_iq[:, :, readout_num, :, :].mean(axis=0).dot([1, 1j])
-                result = []
 
-                # Add software sweep paramters to the result
-                for sweep in software_sweeps:
-                    result.append((sweep.parameters[0], sweep.parameters[0].get()))
+            # The sweep coordinates are the same for every readout of this channel
+            param_values = list(software_param_values)
+
+            # Add hardware sweep parameters to the result
+            sweep_values = [sweep.values for sweep in hardware_sweeps]
+            sweep_values.append(time_axis)
+            sweep_coordinates = _meshgrid_views(sweep_values)
+            for sweep, value in zip(hardware_sweeps, sweep_coordinates[:-1]):
+                param_values.append((sweep.parameter, value))
+            param_values.append((time_parameter, sweep_coordinates[-1]))
 
-                # Add hardware sweep parameters to the result
-                sweep_values = [sweep.values for sweep in hardware_sweeps]
-                sweep_values.append(program.get_time_axis(channel_index))
-                sweep_coordinates = np.meshgrid(*sweep_values, indexing="ij")
-                for sweep, value in zip(hardware_sweeps, sweep_coordinates[:-1]):
-                    result.append((sweep.parameter, value))
-                result.append((time_parameter, sweep_coordinates[-1]))
+            for readout_num in range(reads_per_shot[channel_index]):
+                iq = channel_iq[:, :, readout_num, :].mean(axis=0)
 
                 # Add acquired data to the result
-                result.append((iq_parameters[iq_index], iq.reshape(-1)))
+                datasaver.add_result(
+                    *param_values, (iq_parameters[iq_index], iq.reshape(-1))
+                )
                 iq_index += 1
 
-                datasaver.add_result(*result)
-
 
 class SweepProgram(NDAveragerProgram):
     def __init__(
@@ -358,16 +493,12 @@ class SweepProgram(NDAveragerProgram):
     ):
         self.protocol = protocol
         self.hardware_sweeps = hardware_sweeps
-        self.dacs: set[DacChannel] = set().union(
-            *(instruction.dacs for instruction in self.protocol.instructions)
-        )
-        self.adcs: set[AdcChannel] = set().union(
-            *(instruction.adcs for instruction in self.protocol.instructions)
-        )
+        self.dacs: list[DacChannel] = protocol.dacs
+        self.adcs: list[AdcChannel] = protocol.adcs
 
         cfg = {
-            "reps": protocol.hard_avgs.get(),
-            "rounds": protocol.soft_avgs.get(),
+            "reps": protocol.hard_avgs.cache.get(),
+            "rounds": protocol.soft_avgs.cache.get(),
         }
         super().__init__(soccfg, cfg)
 
@@ -395,7 +526,7 @@ class SweepProgram(NDAveragerProgram):
         for adc in self.adcs:
             adc.initialize(self)
 
-        for instruction in set(self.protocol.instructions):
+        for instruction in self.protocol.unique_instructions:
             instruction.initialize(self)
 
         for sweep in reversed(self.hardware_sweeps):
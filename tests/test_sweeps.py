@@ -1,14 +1,19 @@
 """Unit tests for the tproc v1 sweep logic in qcodes_qick.protocol_base.
 
-These tests run without the hardware. They cover just the logic of
-SoftwareSweep, which is purely pythonic.
+These tests run without the hardware. They cover the logic of
+SoftwareSweep and HardwareSweep, which are purely pythonic, and the
+software sweep loop of SweepProtocol.run with a fake program and
+acquisition.
 """
 
+import contextlib
+
 import numpy as np
 import pytest
-from qcodes import ManualParameter
+from qcodes import Instrument, ManualParameter, Parameter
 
-from qcodes_qick.protocol_base import SoftwareSweep
+from qcodes_qick.parameters import GainParameter
+from qcodes_qick.protocol_base import HardwareSweep, SoftwareSweep, SweepProtocol
 
 
 def _param(unit: str = "") -> ManualParameter:
@@ -37,6 +42,18 @@ def test_skip_first_and_last():
     assert sweep.values[-1] == pytest.approx(0.95)
 
 
+def test_list_input_is_converted_to_array():
+    sweep = SoftwareSweep(_param(), [0.1, 0.2, 0.3, 0.4], skip_last=True)
+    assert isinstance(sweep.values, np.ndarray)
+    np.testing.assert_allclose(sweep.values, [0.1, 0.2, 0.3])
+
+
+def test_mixed_list_keeps_python_values():
+    sweep = SoftwareSweep(_param(), ["auto", 1e-6])
+    assert sweep.values[0] == "auto"
+    assert isinstance(sweep.values[1], float)
+
+
 def test_multiple_parameters_share_units():
     a = ManualParameter("a", unit="Hz")
     b = ManualParameter("b", unit="Hz")
@@ -49,3 +66,106 @@ def test_mismatched_units():
     b = ManualParameter("b", unit="V")
     with pytest.raises(AssertionError):
         SoftwareSweep([a, b], 0, 1, 5)
+
+
+def test_hardware_sweep_values_match_scalar_conversion():
+    gain = GainParameter("gain", initial_value=0)
+    sweep = HardwareSweep(gain, 0, 0.5, 11)
+    assert sweep.num == 11
+    np.testing.assert_array_equal(
+        sweep.values, [gain.int2float(i) for i in sweep.values_int]
+    )
+    assert sweep.values[0] == sweep.start
+    assert sweep.values[-1] == sweep.stop
+
+
+def test_hardware_sweep_skip_first_and_last():
+    gain = GainParameter("gain", initial_value=0)
+    sweep = HardwareSweep(gain, 0, 0.5, 11, skip_first=True, skip_last=True)
+    assert sweep.num == 9
+    assert sweep.start_int == sweep.step_int
+    assert sweep.stop_int == 9 * sweep.step_int
+
+
+# SweepProtocol.run tests: replace the program generation and the acquisition with fakes.
+class FakeQickInstrument(Instrument):
+    """Hardware-free replacement for the tProc v1 `QickInstrument`."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.soccfg = None
+        self.tproc_version = Parameter("tproc_version", initial_cache_value=1)
+
+
+class FakeProgram:
+    def __init__(self, values: tuple[float, ...]):
+        self.values = values
+        self.ro_chs = {0: {"trigs": 1}}
+
+
+class FakeDataSaver:
+    run_id = 1
+
+
+class FakeMeasurement:
+    def register_parameter(self, parameter, setpoints=None, paramtype=None):
+        pass
+
+    @contextlib.contextmanager
+    def run(self):
+        yield FakeDataSaver()
+
+
+class RecordingProtocol(SweepProtocol):
+    """Records the generated programs and the program used by each acquisition."""
+
+    def __init__(self, parent: FakeQickInstrument, name: str):
+        super().__init__(parent, name)
+        self.a = ManualParameter("a", instrument=self, initial_value=0)
+        self.b = ManualParameter("b", instrument=self, initial_value=0)
+        self.programs = []
+        self.acquisitions = []
+
+    def generate_program(self, soccfg, hardware_sweeps=()):  # noqa: ARG002
+        program = FakeProgram((self.a.get(), self.b.get()))
+        self.programs.append(program)
+        return program
+
+    def run_hardware_sweeps(
+        self,
+        datasaver,  # noqa: ARG002
+        program,
+        software_sweeps,  # noqa: ARG002
+        hardware_sweeps,  # noqa: ARG002
+        iq_parameters,  # noqa: ARG002
+        progress=True,  # noqa: ARG002
+    ):
+        self.acquisitions.append((program, (self.a.get(), self.b.get())))
+
+
+def test_run_regenerates_program_only_when_software_values_change():
+    inst = FakeQickInstrument("fake_v1")
+    try:
+        protocol = RecordingProtocol(inst, "protocol")
+        software_sweeps = [
+            SoftwareSweep(protocol.a, [1, 2]),
+            SoftwareSweep(protocol.b, [5, 5, 6]),
+        ]
+        protocol.run(FakeMeasurement(), software_sweeps)
+
+        points = [(1, 5), (1, 5), (1, 6), (2, 5), (2, 5), (2, 6)]
+        assert [values for _, values in protocol.acquisitions] == points
+        # every acquisition runs a program generated for the current values
+        for program, values in protocol.acquisitions:
+            assert program.values == values
+        # the initial program is reused, and a repeated value does not regenerate it
+        assert [program.values for program in protocol.programs] == [
+            (1, 5),
+            (1, 6),
+            (2, 5),
+            (2, 6),
+        ]
+        assert protocol.acquisitions[0][0] is protocol.programs[0]
+        assert protocol.acquisitions[1][0] is protocol.programs[0]
+    finally:
+        inst.close()
@@ -1,15 +1,16 @@
 """Units tests for the tproc v2 sweep logic in qcodes_qick.
 
-These tests cover `SoftwareSweep', `SweepableNumbers' validator, and
-the `SweepableParameter' get/set behaviour.
+These tests cover `SoftwareSweep', `SweepableNumbers' validator,
+the `SweepableParameter' get/set behaviour, and the software sweep loop
+used by `QickInstrument.run'.
 """
 
 import numpy as np
 import pytest
-from qcodes import Instrument, ManualParameter
-from qick.asm_v2 import QickSweep1D
+from qcodes import Instrument, ManualParameter, Parameter
+from qick.asm_v2 import QickParam, QickSweep1D
 
-from qcodes_qick.instrument_v2 import SoftwareSweep
+from qcodes_qick.instrument_v2 import SoftwareSweep, _iterate_software_sweeps
 from qcodes_qick.parameters_v2 import SweepableNumbers, SweepableParameter
 
 
@@ -40,6 +41,28 @@ def test_software_sweep_skip_first_and_last():
     assert sweep.values[-1] == pytest.approx(0.95)
 
 
+def test_software_sweep_list_input_is_converted_to_array(instrument):
+    sweep = SoftwareSweep(_param(), [0.1, 0.2, 0.3, 0.4], skip_last=True)
+    assert isinstance(sweep.values, np.ndarray)
+    np.testing.assert_allclose(sweep.values, [0.1, 0.2, 0.3])
+
+    # integer values become NumPy integers, which must still be wrapped in a QickParam
+    p = _sweepable(instrument)
+    sweep = SoftwareSweep(p, [0, 3, 6])
+    p.set(sweep.values[1])
+    assert isinstance(p.qick_param, QickParam)
+    assert p.get() == 3
+    p.fast_set(sweep.values[2])
+    assert isinstance(p.qick_param, QickParam)
+    assert p.get() == 6
+
+
+def test_software_sweep_mixed_list_keeps_python_values():
+    sweep = SoftwareSweep(_param("sec"), ["auto", 1e-6])
+    assert sweep.values[0] == "auto"
+    assert isinstance(sweep.values[1], float)
+
+
 def test_software_sweep_multiple_parameters_share_units():
     a = ManualParameter("a", unit="Hz")
     b = ManualParameter("b", unit="Hz")
@@ -79,7 +102,7 @@ class FakeQickInstrument(Instrument):
 
     def __init__(self, name: str):
         super().__init__(name)
-        self.swept_params: set = set()
+        self.swept_params: dict = {}
 
 
 @pytest.fixture
@@ -132,3 +155,91 @@ def test_sweepable_parameter_rejects_out_of_range(instrument):
     p = _sweepable(instrument)
     with pytest.raises(ValueError, match="must be between"):
         p.set(70.0)
+
+
+def test_sweepable_parameter_fast_set_scalar(instrument):
+    p = _sweepable(instrument)
+    p.set(QickSweep1D("loop", 4.0, 7.0))
+    p.fast_set(np.float64(3.0))
+    assert p.get() == 3.0
+    assert p.cache.get() == 3.0
+    assert p not in instrument.swept_params
+
+
+def test_sweepable_parameter_fast_set_skips_validator(instrument, monkeypatch):
+    p = _sweepable(instrument)
+
+    def fail(self, value, context=""):  # noqa: ARG001
+        raise AssertionError
+
+    monkeypatch.setattr(SweepableNumbers, "validate", fail)
+    p.fast_set(np.float64(3.0))
+    assert p.cache.get() == 3.0
+
+
+def test_sweepable_parameter_fast_set_falls_back_to_set(instrument):
+    p = _sweepable(instrument)
+    p.fast_set(QickSweep1D("loop", 4.0, 7.0))
+    assert p in instrument.swept_params
+    with pytest.raises(ValueError, match="must be between"):
+        p.fast_set(70.0)
+
+
+def test_sweepable_parameter_repeated_sets_keep_tracking_consistent(instrument):
+    p = _sweepable(instrument)
+    p.set(QickSweep1D("loop", 4.0, 7.0))
+    p.set(QickSweep1D("loop", 2.0, 6.0))
+    assert list(instrument.swept_params) == [p]
+    p.set(3.0)
+    p.set(4.0)
+    assert p not in instrument.swept_params
+
+
+def test_swept_params_keep_assignment_order(instrument):
+    a = _sweepable(instrument)
+    b = SweepableParameter(
+        name="gain",
+        instrument=instrument,
+        label="Gain",
+        unit="",
+        initial_value=0.5,
+    )
+    b.set(QickSweep1D("loop", 0.0, 1.0))
+    a.set(QickSweep1D("loop", 4.0, 7.0))
+    assert list(instrument.swept_params) == [b, a]
+
+
+# Software sweep loop tests: the loop of QickInstrument.run, without the acquisition.
+def _round_current_value(parameter: SweepableParameter) -> None:
+    """Make `parameter` report a rounded value, as generating a program would."""
+    rounded = QickParam(round(parameter.qick_param.start))
+    parameter.qick_param.get_rounded = lambda _loop_counts=None: rounded
+
+
+def test_iterate_software_sweeps_keeps_rounded_first_point(instrument):
+    p = _sweepable(instrument)
+    sweep = SoftwareSweep(p, [1.2, 2.7, 4.4])
+    # QickInstrument.run sets the first values and generates a program with them
+    p.set(sweep.values[0])
+    _round_current_value(p)
+
+    recorded = []
+    for indices in _iterate_software_sweeps([sweep]):
+        if indices != (0,):
+            # later points generate a new program for the new value
+            _round_current_value(p)
+        recorded.append(p.get())
+    assert recorded == [1, 3, 4]
+
+
+def test_iterate_software_sweeps_sets_only_changed_parameters():
+    outer_calls = []
+    inner_calls = []
+    outer = Parameter("outer", set_cmd=outer_calls.append)
+    inner = Parameter("inner", set_cmd=inner_calls.append)
+    software_sweeps = [SoftwareSweep(outer, [1, 2]), SoftwareSweep(inner, [5, 6])]
+
+    indices = list(_iterate_software_sweeps(software_sweeps))
+    assert indices == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert outer_calls == [2]
+    assert inner_calls == [6, 5, 6]